@@ -6,6 +6,7 @@ import pytest
 import httpx
 import respx
 
+import formbridge.client as client_module
 from formbridge import (
     FormBridgeClient,
     FormBridgeClientSync,
@@ -155,15 +156,14 @@ async def test_retry_on_429(client: FormBridgeClient):
     ]
 
     # Override backoffs for fast test
-    import formbridge.client as mod
-    original = mod._RETRY_BACKOFFS
-    mod._RETRY_BACKOFFS = [0.01, 0.01, 0.01]
+    original = client_module._RETRY_BACKOFFS
+    client_module._RETRY_BACKOFFS = [0.01, 0.01, 0.01]
     try:
         sub = await client.get_submission("v", "s1")
         assert sub.submission_id == "s1"
         assert route.call_count == 2
     finally:
-        mod._RETRY_BACKOFFS = original
+        client_module._RETRY_BACKOFFS = original
     await client.close()
 
 
@@ -181,16 +181,15 @@ async def test_retry_5xx_then_fail(client: FormBridgeClient):
         httpx.Response(502, json={"ok": False, "error": {"type": "bad_gateway", "message": "down"}}),
     ]
 
-    import formbridge.client as mod
-    original = mod._RETRY_BACKOFFS
-    mod._RETRY_BACKOFFS = [0.01, 0.01, 0.01]
+    original = client_module._RETRY_BACKOFFS
+    client_module._RETRY_BACKOFFS = [0.01, 0.01, 0.01]
     try:
         with pytest.raises(FormBridgeError) as exc_info:
             await client.get_submission("v", "s1")
         assert exc_info.value.status_code == 502
         assert route.call_count == 4  # 1 initial + 3 retries
     finally:
-        mod._RETRY_BACKOFFS = original
+        client_module._RETRY_BACKOFFS = original
     await client.close()
 
 
@@ -221,9 +220,8 @@ async def test_connection_refused():
     route = respx.get(f"{BASE_URL}/intake/v/submissions/s1")
     route.side_effect = httpx.ConnectError("Connection refused")
 
-    import formbridge.client as mod
-    original = mod._RETRY_BACKOFFS
-    mod._RETRY_BACKOFFS = [0.01, 0.01, 0.01]
+    original = client_module._RETRY_BACKOFFS
+    client_module._RETRY_BACKOFFS = [0.01, 0.01, 0.01]
 
     client = FormBridgeClient(url=BASE_URL, api_key="test-key")
     try:
@@ -232,7 +230,7 @@ async def test_connection_refused():
         assert exc_info.value.is_connectivity_error is True
         assert "Connection" in str(exc_info.value)
     finally:
-        mod._RETRY_BACKOFFS = original
+        client_module._RETRY_BACKOFFS = original
         await client.close()
 
 
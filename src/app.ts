@@ -682,15 +682,7 @@ export function createFormBridgeAppWithIntakes(
       const intake = registry.getIntake(intakeId);
       const intakeSchema = extractSchemaProperties(intake.schema);
       if (intakeSchema?.properties) {
-        const partialSchema: import('./submission-types.js').JSONSchema = {
-          type: 'object',
-          properties: {},
-        };
-        for (const fieldName of Object.keys(initFields)) {
-          if (intakeSchema.properties[fieldName]) {
-            partialSchema.properties![fieldName] = intakeSchema.properties[fieldName];
-          }
-        }
+        const partialSchema = validator.getPartialSchema(intakeSchema, Object.keys(initFields));
         const validationResult = validator.validate(initFields, partialSchema);
         if (!validationResult.valid) {
           return c.json(
@@ -881,15 +873,7 @@ export function createFormBridgeAppWithIntakes(
     const intake = registry.getIntake(intakeId);
     const intakeSchema = extractSchemaProperties(intake.schema);
     if (intakeSchema?.properties) {
-      const partialSchema: import('./submission-types.js').JSONSchema = {
-        type: 'object',
-        properties: {},
-      };
-      for (const fieldName of Object.keys(fields)) {
-        if (intakeSchema.properties[fieldName]) {
-          partialSchema.properties![fieldName] = intakeSchema.properties[fieldName];
-        }
-      }
+      const partialSchema = validator.getPartialSchema(intakeSchema, Object.keys(fields));
       const validationResult = validator.validate(fields, partialSchema);
       if (!validationResult.valid) {
         return c.json(
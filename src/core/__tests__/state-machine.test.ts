@@ -5,125 +5,129 @@
 import { describe, it, expect } from "vitest";
 import {
   assertValidTransition,
+  assertValidTransitionPath,
   InvalidStateTransitionError,
+  TERMINAL_STATES,
   VALID_TRANSITIONS,
 } from "../state-machine.js";
 import type { SubmissionState } from "../../types/intake-contract.js";
 
+type Edge = [SubmissionState, SubmissionState];
+
+const CORE_STATES: SubmissionState[] = [
+  "draft",
+  "in_progress",
+  "awaiting_upload",
+  "submitted",
+  "needs_review",
+  "approved",
+  "rejected",
+  "finalized",
+  "cancelled",
+  "expired",
+];
+
+/**
+ * The lifecycle spec, written out independently of VALID_TRANSITIONS so the
+ * generated matrices below cannot silently follow a change to the table.
+ */
+const EXPECTED_EDGES: Edge[] = [
+  ["draft", "in_progress"],
+  ["draft", "awaiting_upload"],
+  ["draft", "submitted"],
+  ["draft", "needs_review"],
+  ["draft", "cancelled"],
+  ["draft", "expired"],
+  ["in_progress", "awaiting_upload"],
+  ["in_progress", "submitted"],
+  ["in_progress", "needs_review"],
+  ["in_progress", "cancelled"],
+  ["in_progress", "expired"],
+  ["awaiting_upload", "in_progress"],
+  ["awaiting_upload", "cancelled"],
+  ["awaiting_upload", "expired"],
+  ["submitted", "finalized"],
+  ["submitted", "cancelled"],
+  ["needs_review", "approved"],
+  ["needs_review", "rejected"],
+  ["needs_review", "draft"],
+  ["approved", "submitted"],
+  ["approved", "finalized"],
+];
+
+const edgeKeys = (edges: Edge[]): string[] =>
+  edges.map(([from, to]) => `${from} → ${to}`).sort();
+
+/** Every edge declared in VALID_TRANSITIONS */
+const VALID_EDGES: Edge[] = [...VALID_TRANSITIONS].flatMap(([from, targets]) =>
+  [...targets].map((to): Edge => [from, to])
+);
+
+/** Every (from, to) pair over CORE_STATES that VALID_TRANSITIONS does not allow */
+const INVALID_EDGES: Edge[] = CORE_STATES.flatMap((from) =>
+  CORE_STATES.filter((to) => !VALID_TRANSITIONS.get(from)?.has(to)).map(
+    (to): Edge => [from, to]
+  )
+);
+
+/** End-to-end lifecycles from draft, each ending in a terminal state */
+const FLOWS: { name: string; path: SubmissionState[]; final: SubmissionState }[] = [
+  {
+    name: "mixed-mode",
+    path: [
+      "in_progress",
+      "awaiting_upload",
+      "in_progress",
+      "needs_review",
+      "approved",
+      "submitted",
+      "finalized",
+    ],
+    final: "finalized",
+  },
+  { name: "direct submit", path: ["submitted", "finalized"], final: "finalized" },
+  {
+    name: "request changes then reject",
+    path: ["needs_review", "draft", "in_progress", "needs_review", "rejected"],
+    final: "rejected",
+  },
+  { name: "cancel during upload", path: ["awaiting_upload", "cancelled"], final: "cancelled" },
+  { name: "expire in progress", path: ["in_progress", "expired"], final: "expired" },
+];
+
 describe("State Machine", () => {
   describe("VALID_TRANSITIONS map", () => {
-    it("defines transitions for all core states", () => {
-      const expectedStates: SubmissionState[] = [
-        "draft",
-        "in_progress",
-        "awaiting_upload",
-        "submitted",
-        "needs_review",
-        "approved",
-        "rejected",
-        "finalized",
-        "cancelled",
-        "expired",
-      ];
-      for (const state of expectedStates) {
-        expect(VALID_TRANSITIONS.has(state)).toBe(true);
-      }
+    it.each(CORE_STATES)("defines transitions for %s", (state) => {
+      expect(VALID_TRANSITIONS.has(state)).toBe(true);
     });
 
     it("terminal states have no valid transitions", () => {
-      const terminalStates: SubmissionState[] = [
-        "rejected",
-        "finalized",
-        "cancelled",
-        "expired",
-      ];
-      for (const state of terminalStates) {
-        const transitions = VALID_TRANSITIONS.get(state);
-        expect(transitions?.size).toBe(0);
-      }
+      const expected = ["cancelled", "expired", "finalized", "rejected"];
+      const terminalStates = [...VALID_TRANSITIONS]
+        .filter(([, targets]) => targets.size === 0)
+        .map(([state]) => state);
+      expect([...terminalStates].sort()).toEqual(expected);
+      expect([...TERMINAL_STATES].sort()).toEqual(expected);
     });
   });
 
   describe("assertValidTransition", () => {
-    it("allows draft → in_progress", () => {
-      expect(() => assertValidTransition("draft", "in_progress")).not.toThrow();
-    });
-
-    it("allows draft → submitted", () => {
-      expect(() => assertValidTransition("draft", "submitted")).not.toThrow();
+    it("VALID_TRANSITIONS declares exactly the expected edges", () => {
+      expect(edgeKeys(VALID_EDGES)).toEqual(edgeKeys(EXPECTED_EDGES));
     });
 
-    it("allows draft → needs_review", () => {
-      expect(() => assertValidTransition("draft", "needs_review")).not.toThrow();
+    it.each(VALID_EDGES)("allows %s → %s", (from, to) => {
+      expect(() => assertValidTransition(from, to)).not.toThrow();
     });
 
-    it("allows draft → awaiting_upload", () => {
-      expect(() => assertValidTransition("draft", "awaiting_upload")).not.toThrow();
-    });
-
-    it("allows in_progress → submitted", () => {
-      expect(() => assertValidTransition("in_progress", "submitted")).not.toThrow();
-    });
-
-    it("allows in_progress → needs_review", () => {
-      expect(() => assertValidTransition("in_progress", "needs_review")).not.toThrow();
-    });
-
-    it("allows in_progress → awaiting_upload", () => {
-      expect(() => assertValidTransition("in_progress", "awaiting_upload")).not.toThrow();
-    });
-
-    it("allows awaiting_upload → in_progress", () => {
-      expect(() => assertValidTransition("awaiting_upload", "in_progress")).not.toThrow();
-    });
-
-    it("allows needs_review → approved", () => {
-      expect(() => assertValidTransition("needs_review", "approved")).not.toThrow();
-    });
-
-    it("allows needs_review → rejected", () => {
-      expect(() => assertValidTransition("needs_review", "rejected")).not.toThrow();
-    });
-
-    it("allows needs_review → draft (request changes)", () => {
-      expect(() => assertValidTransition("needs_review", "draft")).not.toThrow();
-    });
-
-    it("allows approved → submitted", () => {
-      expect(() => assertValidTransition("approved", "submitted")).not.toThrow();
-    });
-
-    it("allows submitted → finalized", () => {
-      expect(() => assertValidTransition("submitted", "finalized")).not.toThrow();
-    });
-
-    // Invalid transitions
-    it("rejects submitted → draft", () => {
-      expect(() => assertValidTransition("submitted", "draft")).toThrow(
-        InvalidStateTransitionError
-      );
-    });
-
-    it("rejects finalized → anything", () => {
-      expect(() => assertValidTransition("finalized", "draft")).toThrow(
-        InvalidStateTransitionError
-      );
-    });
-
-    it("rejects rejected → anything", () => {
-      expect(() => assertValidTransition("rejected", "draft")).toThrow(
+    it.each(INVALID_EDGES)("rejects %s → %s", (from, to) => {
+      expect(() => assertValidTransition(from, to)).toThrow(
         InvalidStateTransitionError
       );
     });
 
-    it("rejects cancelled → anything", () => {
-      expect(() => assertValidTransition("cancelled", "draft")).toThrow(
-        InvalidStateTransitionError
-      );
-    });
-
-    it("rejects expired → anything", () => {
-      expect(() => assertValidTransition("expired", "in_progress")).toThrow(
+    it("rejects submitted → draft", () => {
+      expect(() => assertValidTransition("submitted", "draft")).toThrow(
         InvalidStateTransitionError
       );
     });
@@ -148,4 +152,27 @@ describe("State Machine", () => {
       }
     });
   });
+
+  describe("assertValidTransitionPath", () => {
+    it.each(FLOWS)("returns the final state of the $name flow", ({ path, final }) => {
+      expect(assertValidTransitionPath("draft", path)).toBe(final);
+      expect(TERMINAL_STATES.has(final)).toBe(true);
+    });
+
+    it("returns the starting state for an empty path", () => {
+      expect(assertValidTransitionPath("submitted", [])).toBe("submitted");
+    });
+
+    it("reports the first invalid step", () => {
+      try {
+        assertValidTransitionPath("draft", ["in_progress", "approved", "finalized"]);
+        expect.unreachable("Should have thrown");
+      } catch (error) {
+        expect(error).toBeInstanceOf(InvalidStateTransitionError);
+        const e = error as InvalidStateTransitionError;
+        expect(e.from).toBe("in_progress");
+        expect(e.to).toBe("approved");
+      }
+    });
+  });
 });
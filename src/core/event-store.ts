@@ -191,7 +191,11 @@ export class InMemoryEventStore implements EventStore {
   /** Monotonically increasing version counter per submission */
   private readonly versionCounters: Map<string, number> = new Map();
 
-  /** Bounded recent events list for O(k) analytics queries */
+  /**
+   * Bounded recent events list for O(k) analytics queries (oldest first).
+   * Appends are O(1) push; the head is trimmed in one splice once the list
+   * reaches twice the bound, instead of an unshift that shifts every entry.
+   */
   private readonly recentEvents: IntakeEvent[] = [];
   private readonly maxRecentEvents = 100;
 
@@ -255,10 +259,10 @@ export class InMemoryEventStore implements EventStore {
       events.splice(lo, 0, versionedEvent);
     }
 
-    // Maintain bounded recent events list (newest first)
-    this.recentEvents.unshift(versionedEvent);
-    if (this.recentEvents.length > this.maxRecentEvents) {
-      this.recentEvents.length = this.maxRecentEvents;
+    // Maintain bounded recent events list (amortized O(1) append)
+    this.recentEvents.push(versionedEvent);
+    if (this.recentEvents.length >= this.maxRecentEvents * 2) {
+      this.recentEvents.splice(0, this.recentEvents.length - this.maxRecentEvents);
     }
 
     // Maintain type index
@@ -485,7 +489,12 @@ export class InMemoryEventStore implements EventStore {
    * O(k) where k = min(limit, maxRecentEvents).
    */
   getRecentEventsAll(limit: number): IntakeEvent[] {
-    return this.recentEvents.slice(0, limit);
+    const count = Math.min(limit, this.maxRecentEvents, this.recentEvents.length);
+    const result: IntakeEvent[] = [];
+    for (let i = this.recentEvents.length - 1; result.length < count; i--) {
+      result.push(this.recentEvents[i]!);
+    }
+    return result;
   }
 
   /**
@@ -67,6 +67,16 @@ export const VALID_TRANSITIONS: ReadonlyMap<
   ["expired", new Set<SubmissionState>()],
 ]);
 
+/**
+ * States with no outgoing transitions, derived from VALID_TRANSITIONS so the
+ * two cannot drift apart.
+ */
+export const TERMINAL_STATES: ReadonlySet<SubmissionState> = new Set(
+  [...VALID_TRANSITIONS]
+    .filter(([, targets]) => targets.size === 0)
+    .map(([state]) => state)
+);
+
 /**
  * Assert that a state transition is valid.
  *
@@ -83,3 +93,26 @@ export function assertValidTransition(
     throw new InvalidStateTransitionError(from, to);
   }
 }
+
+/**
+ * Assert that every step of a transition path is valid.
+ *
+ * Walks the path in a single pass and stops at the first invalid step, so a
+ * multi-step flow can be checked up front without mutating any submission.
+ *
+ * @param from - Starting state
+ * @param path - Successive target states
+ * @returns The final state reached (or `from` for an empty path)
+ * @throws {InvalidStateTransitionError} For the first step that is not allowed
+ */
+export function assertValidTransitionPath(
+  from: SubmissionState,
+  path: readonly SubmissionState[]
+): SubmissionState {
+  let current = from;
+  for (const next of path) {
+    assertValidTransition(current, next);
+    current = next;
+  }
+  return current;
+}
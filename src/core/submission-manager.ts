@@ -21,7 +21,7 @@ import { Validator, type UploadStatus } from "./validator.js";
 import type { EventStore } from "./event-store.js";
 import { InMemoryEventStore } from "./event-store.js";
 import type { PiiRedactor } from "./pii-redactor.js";
-import { assertValidTransition } from "./state-machine.js";
+import { assertValidTransition, TERMINAL_STATES } from "./state-machine.js";
 import { randomUUID } from "crypto";
 import { SubmissionId, ResumeToken, EventId } from "../types/branded.js";
 import { notifyHandoff } from "./handoff-notifier.js";
@@ -53,8 +53,12 @@ function getUploads(fields: Record<string, unknown>): Record<string, UploadStatu
   return isUploadStatusMap(fields.__uploads) ? fields.__uploads : {};
 }
 
-/** Terminal states that should not be expired */
-const TERMINAL_STATES = new Set(['rejected', 'finalized', 'cancelled', 'expired']);
+/**
+ * Fallback schema for validate() when no intake is registered. Kept as a single
+ * shared reference so the Validator's identity cache hits instead of
+ * re-stringifying a fresh literal on every call.
+ */
+const EMPTY_OBJECT_SCHEMA: JSONSchema = Object.freeze({ type: "object" });
 
 export interface SubmissionStore {
   get(submissionId: string): Promise<Submission | null>;
@@ -936,7 +940,7 @@ export class SubmissionManager {
       throw new SubmissionNotFoundError(submissionId);
     }
 
-    let schema: JSONSchema = { type: "object" };
+    let schema: JSONSchema = EMPTY_OBJECT_SCHEMA;
     if (this.intakeRegistry) {
       try {
         const intake = this.intakeRegistry.getIntake(submission.intakeId);
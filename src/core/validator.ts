@@ -19,6 +19,9 @@ import type {
   FieldErrorCode,
 } from '../submission-types.js';
 
+/** Bound on memoized partial schemas per intake schema (distinct field sets). */
+const MAX_PARTIAL_SCHEMAS_PER_SCHEMA = 256;
+
 /**
  * Upload status tracking.
  */
@@ -76,6 +79,8 @@ export class Validator {
   private readonly ajv: Ajv;
   private readonly compiledSchemas: Map<string, ValidateFunction> = new Map();
   private readonly weakCache = new WeakMap<object, ValidateFunction>();
+  private readonly partialSchemas = new WeakMap<JSONSchema, Map<string, JSONSchema>>();
+  private readonly fileFieldsCache = new WeakMap<JSONSchema, readonly string[]>();
 
   constructor(config: ValidatorConfig = {}) {
     this.ajv = new Ajv({
@@ -116,6 +121,17 @@ export class Validator {
     // Run validation
     const valid = validate(data);
 
+    // Fast path: nothing to convert and no file fields for uploads to fail on
+    if (valid && (!uploads || this.getFileFields(schema).length === 0)) {
+      return {
+        valid: true,
+        errors: [],
+        nextActions: [],
+        missingFields: [],
+        invalidFields: [],
+      };
+    }
+
     // Convert Ajv errors to our structured format
     const ajvErrors = validate.errors ?? [];
     const { errors, missingFields, invalidFields } = this.convertAjvErrors(ajvErrors, schema);
@@ -226,13 +242,27 @@ export class Validator {
 
     // Get all file fields from the schema
     const fileFields = this.getFileFields(schema);
+    if (fileFields.length === 0) {
+      return { errors, missingFields, invalidFields };
+    }
+
+    // Group uploads by field in one pass instead of rescanning per file field
+    const uploadsByField = new Map<string, UploadStatus[]>();
+    for (const upload of Object.values(uploads)) {
+      const group = uploadsByField.get(upload.field);
+      if (group) {
+        group.push(upload);
+      } else {
+        uploadsByField.set(upload.field, [upload]);
+      }
+    }
 
     for (const fieldPath of fileFields) {
       const fieldSchema = this.getFieldSchema(fieldPath, schema);
       const isRequired = schema.required?.includes(fieldPath) ?? false;
 
       // Find all uploads for this field
-      const fieldUploads = Object.values(uploads).filter((u) => u.field === fieldPath);
+      const fieldUploads = uploadsByField.get(fieldPath) ?? [];
 
       if (fieldUploads.length === 0) {
         // No upload initiated for this field
@@ -296,25 +326,30 @@ export class Validator {
   /**
    * Gets all file field paths from a schema.
    * File fields are identified by format: 'binary'.
+   * The result depends only on the schema, so it is computed once per schema object.
    *
    * @param schema - The JSON Schema
    * @returns Array of field paths that are file fields
    */
-  private getFileFields(schema: JSONSchema): string[] {
-    const fileFields: string[] = [];
-
-    if (!schema.properties) {
-      return fileFields;
+  private getFileFields(schema: JSONSchema): readonly string[] {
+    const cached = this.fileFieldsCache.get(schema);
+    if (cached) {
+      return cached;
     }
 
-    for (const [fieldName, fieldSchema] of Object.entries(schema.properties)) {
-      if (fieldSchema && typeof fieldSchema === 'object') {
-        if (fieldSchema.format === 'binary') {
-          fileFields.push(fieldName);
+    const fileFields: string[] = [];
+
+    if (schema.properties) {
+      for (const [fieldName, fieldSchema] of Object.entries(schema.properties)) {
+        if (fieldSchema && typeof fieldSchema === 'object') {
+          if (fieldSchema.format === 'binary') {
+            fileFields.push(fieldName);
+          }
         }
       }
     }
 
+    this.fileFieldsCache.set(schema, fileFields);
     return fileFields;
   }
 
@@ -390,6 +425,44 @@ export class Validator {
     return validate;
   }
 
+  /**
+   * Builds the partial schema used to validate only the provided fields.
+   *
+   * The result holds just the `properties` entries of `schema` that `fieldNames`
+   * select (no `required`), so partial updates are type-checked without a
+   * completeness check. Partial schemas are memoized per source schema and
+   * field set, which lets repeated requests for the same fields reuse one
+   * object and hit the compiled-schema identity cache.
+   *
+   * @param schema - The full intake schema
+   * @param fieldNames - Names of the fields being validated
+   * @returns A schema restricted to the known fields in `fieldNames`
+   */
+  getPartialSchema(schema: JSONSchema, fieldNames: readonly string[]): JSONSchema {
+    const properties = schema.properties ?? {};
+    const selected = fieldNames.filter((name) => Object.hasOwn(properties, name) && properties[name]);
+    const key = selected.join('\u0000');
+
+    let bySchema = this.partialSchemas.get(schema);
+    if (!bySchema) {
+      bySchema = new Map();
+      this.partialSchemas.set(schema, bySchema);
+    }
+
+    let partialSchema = bySchema.get(key);
+    if (!partialSchema) {
+      partialSchema = { type: 'object', properties: {} };
+      for (const name of selected) {
+        partialSchema.properties![name] = properties[name]!;
+      }
+      if (bySchema.size >= MAX_PARTIAL_SCHEMAS_PER_SCHEMA) {
+        bySchema.clear();
+      }
+      bySchema.set(key, partialSchema);
+    }
+    return partialSchema;
+  }
+
   /**
    * Creates a stable cache key for a schema.
    */
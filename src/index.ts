@@ -134,7 +134,7 @@ export { SubmissionManager } from './core/submission-manager.js';
 export { ApprovalManager } from './core/approval-manager.js';
 export { InMemoryEventStore } from './core/event-store.js';
 export type { EventStore, EventFilters } from './core/event-store.js';
-export { assertValidTransition, InvalidStateTransitionError, VALID_TRANSITIONS } from './core/state-machine.js';
+export { assertValidTransition, InvalidStateTransitionError, TERMINAL_STATES, VALID_TRANSITIONS } from './core/state-machine.js';
 
 // =============================================================================
 // Webhook & Delivery
@@ -189,11 +189,7 @@ export function validatePartialFields(
   fields: Record<string, unknown>
 ): IntakeErrorFlat | null {
   if (!isSchemaWithProperties(intakeSchema)) return null;
-  const partialSchema: JSONSchema = { type: 'object', properties: {} };
-  for (const fieldName of Object.keys(fields)) {
-    const prop = intakeSchema.properties?.[fieldName];
-    if (prop) partialSchema.properties![fieldName] = prop;
-  }
+  const partialSchema = validator.getPartialSchema(intakeSchema, Object.keys(fields));
   const result = validator.validate(fields, partialSchema);
   if (result.valid) return null;
   return {
@@ -9,6 +9,7 @@ import type { StorageBackend } from "./storage-backend.js";
 import { InMemoryEventStore } from "../core/event-store.js";
 import { InMemoryDeliveryQueue, type DeliveryQueue } from "../core/delivery-queue.js";
 import { timingSafeTokenCompare } from "../core/errors.js";
+import { TERMINAL_STATES } from "../core/state-machine.js";
 import type {
   FormBridgeStorage,
   SubmissionStorage,
@@ -18,9 +19,6 @@ import type {
   StorageTransaction,
 } from "./storage-interface.js";
 
-/** Terminal states that are never eligible for TTL expiry. */
-const TERMINAL_STATES = new Set(["rejected", "finalized", "cancelled", "expired"]);
-
 // =============================================================================
 // § In-Memory Submission Storage
 // =============================================================================
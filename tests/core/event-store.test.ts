@@ -0,0 +1,88 @@
+/**
+ * InMemoryEventStore — bounded recent-events buffer behind getRecentEventsAll.
+ */
+
+import { describe, it, expect, beforeEach } from "vitest";
+import { InMemoryEventStore } from "../../src/core/event-store.js";
+import { EventId, SubmissionId } from "../../src/types/branded.js";
+import type { IntakeEvent } from "../../src/types/intake-contract.js";
+
+const ACTOR = { kind: "agent" as const, id: "agent-1" };
+const OLD_TS = "2000-01-01T00:00:00.000Z";
+
+function makeEvent(n: number, ts = new Date(Date.now() + n).toISOString()): IntakeEvent {
+  return {
+    eventId: EventId(`evt_${n}`),
+    type: "field.updated",
+    submissionId: SubmissionId(`sub_${n % 3}`),
+    ts,
+    actor: ACTOR,
+    state: "in_progress",
+    payload: {},
+  };
+}
+
+async function appendMany(store: InMemoryEventStore, count: number): Promise<void> {
+  for (let n = 0; n < count; n++) {
+    await store.appendEvent(makeEvent(n));
+  }
+}
+
+const ids = (events: IntakeEvent[]): string[] => events.map((e) => e.eventId);
+
+describe("InMemoryEventStore.getRecentEventsAll", () => {
+  let store: InMemoryEventStore;
+
+  beforeEach(() => {
+    store = new InMemoryEventStore();
+  });
+
+  it("returns events newest first when fewer than the limit exist", async () => {
+    await appendMany(store, 3);
+
+    expect(ids(store.getRecentEventsAll(10))).toEqual(["evt_2", "evt_1", "evt_0"]);
+  });
+
+  it("keeps the newest events after the buffer is trimmed", async () => {
+    // 250 appends crosses the trim point at twice the 100-event bound
+    await appendMany(store, 250);
+
+    expect(ids(store.getRecentEventsAll(3))).toEqual(["evt_249", "evt_248", "evt_247"]);
+  });
+
+  it("caps the result at 100 events", async () => {
+    await appendMany(store, 250);
+
+    const recent = store.getRecentEventsAll(150);
+    expect(recent).toHaveLength(100);
+    expect(recent[0]?.eventId).toBe("evt_249");
+    expect(recent[99]?.eventId).toBe("evt_150");
+  });
+
+  it("still holds a full 100 events right after a trim", async () => {
+    // The 200th append is the one that trims the buffer
+    await appendMany(store, 200);
+
+    const recent = store.getRecentEventsAll(150);
+    expect(recent).toHaveLength(100);
+    expect(recent[99]?.eventId).toBe("evt_100");
+  });
+
+  it("returns nothing for a limit of 0", async () => {
+    await appendMany(store, 5);
+
+    expect(store.getRecentEventsAll(0)).toEqual([]);
+  });
+
+  it("drops cleaned-up events from the buffer", async () => {
+    for (let n = 0; n < 5; n++) {
+      await store.appendEvent(makeEvent(n, OLD_TS));
+    }
+    for (let n = 5; n < 8; n++) {
+      await store.appendEvent(makeEvent(n));
+    }
+
+    expect(await store.cleanupOld(60_000)).toBe(5);
+    expect(ids(store.getRecentEventsAll(100))).toEqual(["evt_7", "evt_6", "evt_5"]);
+  });
+});
@@ -50,8 +50,7 @@ describe('Validator', () => {
       // Should have errors for both required fields
       expect(result.valid).toBe(false);
       expect(result.errors).toHaveLength(2);
-      expect(result.missingFields).toContain('avatar');
-      expect(result.missingFields).toContain('name');
+      expect([...result.missingFields].sort()).toEqual(['avatar', 'name']);
     });
 
     it('should validate completed file uploads with size constraints', () => {
@@ -219,6 +218,31 @@ describe('Validator', () => {
       expect(result.errors).toHaveLength(0);
       expect(result.nextActions).toHaveLength(0);
     });
+
+    it('should accept an empty upload map when the schema has no file fields', () => {
+      const plainSchema: JSONSchema = {
+        type: 'object',
+        properties: { name: { type: 'string' } },
+        required: ['name'],
+      };
+
+      const result = validator.validate({ name: 'John Doe' }, plainSchema, {});
+
+      expect(result.valid).toBe(true);
+      expect(result.errors).toHaveLength(0);
+      expect(result.missingFields).toHaveLength(0);
+    });
+
+    it('should still check uploads for schema-valid data with file fields', () => {
+      // avatar passes the schema as a string but has no upload behind it
+      const data = { avatar: 'avatar.png', name: 'John Doe' };
+
+      const result = validator.validate(data, fileFieldSchema, {});
+
+      expect(result.valid).toBe(false);
+      expect(result.missingFields).toEqual(['avatar']);
+      expect(result.errors[0]?.code).toBe('file_required');
+    });
   });
 
   describe('Schema Caching', () => {
@@ -289,6 +313,26 @@ describe('Validator', () => {
       expect(result2.valid).toBe(false); // Fails minLength: 5
       expect(result2.errors[0].code).toBe('too_short');
     });
+
+    it('should reuse partial schemas for the same field set', () => {
+      const schema: JSONSchema = {
+        type: 'object',
+        properties: {
+          name: { type: 'string' },
+          age: { type: 'number' },
+        },
+        required: ['name', 'age'],
+      };
+
+      const partial = validator.getPartialSchema(schema, ['age', 'unknown']);
+      expect(partial).toEqual({ type: 'object', properties: { age: { type: 'number' } } });
+      expect(validator.getPartialSchema(schema, ['age', 'unknown'])).toBe(partial);
+      expect(validator.getPartialSchema(schema, ['name'])).not.toBe(partial);
+
+      // No required check: a partial update with only valid fields passes
+      expect(validator.validate({ age: 30 }, partial).valid).toBe(true);
+      expect(validator.validate({ age: 'thirty' }, partial).valid).toBe(false);
+    });
   });
 
   describe('Ajv Error Conversion', () => {
@@ -314,8 +358,7 @@ describe('Validator', () => {
       expect(nameError?.expected).toBe('a value');
       expect(nameError?.received).toBeUndefined();
 
-      expect(result.missingFields).toContain('name');
-      expect(result.missingFields).toContain('email');
+      expect([...result.missingFields].sort()).toEqual(['email', 'name']);
     });
 
     it('should convert type mismatch errors', () => {
@@ -338,8 +381,7 @@ describe('Validator', () => {
       expect(ageError?.expected).toBe('number');
       expect(ageError?.received).toBe('string');
 
-      expect(result.invalidFields).toContain('age');
-      expect(result.invalidFields).toContain('active');
+      expect([...result.invalidFields].sort()).toEqual(['active', 'age']);
     });
 
     it('should convert pattern validation errors', () => {
@@ -787,8 +829,7 @@ describe('Validator', () => {
       const result = validator.validateRequired({ optional: 'present' }, schema);
 
       expect(result.valid).toBe(false);
-      expect(result.missingFields).toContain('name');
-      expect(result.missingFields).toContain('email');
+      expect([...result.missingFields].sort()).toEqual(['email', 'name']);
       expect(result.errors).toHaveLength(2);
       
       result.errors.forEach(error => {
@@ -896,15 +937,12 @@ describe('Validator', () => {
       expect(result.errors.length).toBeGreaterThan(3);
 
       // Should have various types of errors
-      const hasRequiredError = result.errors.some(e => e.code === 'required');
-      const hasFormatError = result.errors.some(e => e.code === 'invalid_format');
-      const hasValueError = result.errors.some(e => e.code === 'invalid_value');
-      const hasLengthError = result.errors.some(e => e.code === 'too_short');
-
-      expect(hasRequiredError).toBe(true);
-      expect(hasFormatError).toBe(true);
-      expect(hasValueError).toBe(true);
-      expect(hasLengthError).toBe(true);
+      const errorCodes = new Set(result.errors.map(e => e.code));
+
+      expect(errorCodes.has('required')).toBe(true);
+      expect(errorCodes.has('invalid_format')).toBe(true);
+      expect(errorCodes.has('invalid_value')).toBe(true);
+      expect(errorCodes.has('too_short')).toBe(true);
 
       // Should generate various next actions
       expect(result.nextActions.length).toBeGreaterThan(0);